@@ -1,7 +1,16 @@
+import hashlib
+import json
 from typing import Any, Dict, List
 
+from backend.core.responses import gzip_body
+
 MENU_REGISTRY: List[Dict[str, Any]] = []
 
+# Pre-rendered registry, populated by freeze() once all apps have registered
+_FROZEN_JSON: bytes = b""
+_FROZEN_JSON_GZIP: bytes = b""
+_FROZEN_ETAG: str = ""
+
 
 def register_module_menu(menu_definition: Dict[str, Any]) -> None:
     """
@@ -18,6 +27,9 @@ def register_module_menu(menu_definition: Dict[str, Any]) -> None:
         ]
     }
     """
+    if _FROZEN_JSON:
+        raise RuntimeError("Menu registry is frozen; register menus in AppConfig.ready()")
+
     # Basic validation to avoid bad registrations breaking the menu
     required_keys = {"id", "title", "routes"}
     if not required_keys.issubset(menu_definition.keys()):
@@ -30,3 +42,33 @@ def get_registered_menus() -> List[Dict[str, Any]]:
     return MENU_REGISTRY
 
 
+def freeze() -> None:
+    """
+    Pre-render the registry to JSON and block further registrations.
+    Called lazily on first read, after every AppConfig.ready() has run.
+    """
+    global _FROZEN_JSON, _FROZEN_JSON_GZIP, _FROZEN_ETAG
+    if _FROZEN_JSON:
+        return
+
+    payload = json.dumps(MENU_REGISTRY, separators=(",", ":")).encode()
+    _FROZEN_ETAG = hashlib.md5(payload).hexdigest()
+    _FROZEN_JSON_GZIP = gzip_body(payload)
+    _FROZEN_JSON = payload
+
+
+def get_menu_json() -> bytes:
+    freeze()
+    return _FROZEN_JSON
+
+
+def get_menu_json_gzip() -> bytes:
+    freeze()
+    return _FROZEN_JSON_GZIP
+
+
+def get_menu_etag() -> str:
+    freeze()
+    return _FROZEN_ETAG
+
+
@@ -0,0 +1,38 @@
+import gzip
+
+from django.http import HttpResponse
+from django.middleware.gzip import re_accepts_gzip
+from django.utils.cache import patch_vary_headers
+
+
+def gzip_body(body: bytes) -> bytes:
+    """Compress a pre-rendered body once, deterministically (no timestamp)."""
+    return gzip.compress(body, mtime=0)
+
+
+def accepts_gzip(request) -> bool:
+    return bool(re_accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", "")))
+
+
+def variant_etag(request, etag: str) -> str:
+    """
+    Weaken an ETag for the gzip variant, as GZipMiddleware does, so the
+    compressed and identity bodies never share a strong validator.
+    """
+    return f'W/"{etag}"' if accepts_gzip(request) else etag
+
+
+def precompressed_json_response(request, body: bytes, gzipped_body: bytes) -> HttpResponse:
+    """
+    Return a pre-rendered JSON body, using its pre-compressed copy when the
+    client accepts gzip so GZipMiddleware doesn't recompress it per request.
+    """
+    if accepts_gzip(request):
+        response = HttpResponse(gzipped_body, content_type="application/json")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
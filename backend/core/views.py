@@ -1,18 +1,34 @@
-from rest_framework.response import Response
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
 from rest_framework.views import APIView
 
-from backend.core.menu import get_registered_menus
+from backend.core.menu import get_menu_etag, get_menu_json, get_menu_json_gzip
 from backend.core.permissions import IsInternalUser
+from backend.core.renderers import FirstRendererNegotiation, OrjsonRenderer
+from backend.core.responses import precompressed_json_response, variant_etag
+
+
+def _menu_etag(request, *args, **kwargs) -> str:
+    return variant_etag(request, get_menu_etag())
 
 
 class MenuView(APIView):
     """
     Exposes the global menu registry.
+    The registry is immutable once apps are loaded, so the pre-rendered
+    JSON is returned directly instead of going through DRF rendering.
     """
 
     permission_classes = [IsInternalUser]
+    # Read-only endpoint with a single JSON representation
+    renderer_classes = [OrjsonRenderer]
+    parser_classes = []
+    content_negotiation_class = FirstRendererNegotiation
 
+    @method_decorator(cache_control(private=True, max_age=30))
+    @method_decorator(etag(_menu_etag))
     def get(self, request, *args, **kwargs):
-        return Response(get_registered_menus())
+        return precompressed_json_response(request, get_menu_json(), get_menu_json_gzip())
 
 
@@ -1,4 +1,11 @@
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
 from django.urls import path
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -6,11 +13,18 @@ from rest_framework.views import APIView
 
 from backend.core.permissions import IsInternalUser
 from backend.modules.backups.services import (
+    get_backup_by_id,
     get_download_link,
     get_restore_preview,
+    invalidate_listing_cache,
     list_backup_versions,
     list_repositories,
-    restore_to_azure_devops,
+)
+from backend.modules.backups.tasks import (
+    BULK_RESTORE_MAX_ITEMS,
+    get_restore_job,
+    submit_bulk_restore,
+    submit_restore,
 )
 
 
@@ -19,6 +33,7 @@ class RepositoriesListView(APIView):
 
     permission_classes = [IsInternalUser]
 
+    @method_decorator(cache_control(private=True, max_age=30))
     def get(self, request: Request) -> Response:
         repos = list_repositories()
         return Response(repos)
@@ -29,6 +44,7 @@ class BackupVersionsView(APIView):
 
     permission_classes = [IsInternalUser]
 
+    @method_decorator(cache_control(private=True, max_age=30))
     def get(self, request: Request, repo_id: str) -> Response:
         versions = list_backup_versions(repo_id)
         return Response(versions)
@@ -65,7 +81,11 @@ class DownloadLinkView(APIView):
                 {"error": "backup_id is required"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        download_url = get_download_link(repo_id, backup_id)
+        backup = get_backup_by_id(repo_id, backup_id)
+        if not backup:
+            return Response({"error": "Backup not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        download_url = get_download_link(backup["blob_path"])
         if not download_url:
             return Response(
                 {"error": "Failed to generate download link"},
@@ -95,45 +115,156 @@ class RestoreView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        result = restore_to_azure_devops(
-            repo_id=repo_id,
-            backup_id=backup_id,
+        backup = get_backup_by_id(repo_id, backup_id)
+        if not backup:
+            return Response({"error": "Backup not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        job_id = submit_restore(
+            backup=backup,
             target_org=target_org,
             target_project=target_project,
             target_repo_name=target_repo_name,
             visibility=visibility,
         )
 
-        if result["status"] == "error":
-            return Response(result, status=status.HTTP_400_BAD_REQUEST)
+        return Response(get_restore_job(job_id), status=status.HTTP_202_ACCEPTED)
+
+
+class RestoreJobView(APIView):
+    """Get the state of a background restore job."""
+
+    permission_classes = [IsInternalUser]
+
+    def get(self, request: Request, job_id: str) -> Response:
+        job = get_restore_job(job_id)
+        if not job:
+            return Response({"error": "Restore job not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        return Response(result, status=status.HTTP_200_OK)
+        return Response(job)
+
+
+class BulkRestoreView(APIView):
+    """Restore several backups to Azure DevOps as one background job."""
+
+    permission_classes = [IsInternalUser]
+
+    def post(self, request: Request) -> Response:
+        items = request.data.get("restores")
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"error": "restores must be a non-empty list"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(items) > BULK_RESTORE_MAX_ITEMS:
+            return Response(
+                {"error": f"At most {BULK_RESTORE_MAX_ITEMS} restores are allowed per request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        required = ("repo_id", "backup_id", "target_org", "target_project", "target_repo_name")
+        restores = []
+        for item in items:
+            if (
+                not isinstance(item, dict)
+                or not all(isinstance(item.get(key), str) and item[key] for key in required)
+                or not isinstance(item.get("visibility", "private"), str)
+            ):
+                return Response(
+                    {
+                        "error": "Each restore requires repo_id, backup_id, target_org, target_project, and target_repo_name as non-empty strings"
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            restores.append(
+                {
+                    "repo_id": item["repo_id"],
+                    "backup_id": item["backup_id"],
+                    "target_org": item["target_org"],
+                    "target_project": item["target_project"],
+                    "target_repo_name": item["target_repo_name"],
+                    "visibility": item.get("visibility", "private"),
+                }
+            )
+
+        # Backups are resolved in the job, so the request never lists storage
+        job_id = submit_bulk_restore(restores)
+        return Response(get_restore_job(job_id), status=status.HTTP_202_ACCEPTED)
+
+
+class CacheInvalidateView(APIView):
+    """Drop cached repository and backup version listings."""
+
+    permission_classes = [IsInternalUser]
+
+    def post(self, request: Request) -> Response:
+        invalidate_listing_cache()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+def _backup_status_payload(repos: List[Dict[str, Any]]) -> Dict[str, Any]:
+    # Transform to legacy format for backward compatibility
+    return {
+        "summary": {
+            "repositories_monitored": len(repos),
+            "healthy": len(repos),
+            "failing": 0,
+            "last_run": repos[0]["last_backup"] if repos else None,
+        },
+        "repositories": [
+            {
+                "name": f"{r['org']}/{r['project']}/{r['repo']}",
+                "provider": "Azure DevOps",
+                "last_backup": r["last_backup"],
+                "status": "Healthy",
+            }
+            for r in repos
+        ],
+    }
+
+
+# (listing, payload, etag) for the last cached listing seen; the listing is
+# held so its identity can't be reused by a later one
+_last_backup_status: Optional[Tuple[List[Dict[str, Any]], Dict[str, Any], str]] = None
+
+
+def _backup_status(request: Request) -> Tuple[Dict[str, Any], str]:
+    """
+    Return the legacy status payload and its ETag.
+    Both are computed once per listing-cache fill, and shared by the ETag
+    check and the view within a request so storage is listed at most once.
+    """
+    global _last_backup_status
+    status_ = getattr(request, "_backup_status", None)
+    if status_ is not None:
+        return status_
+
+    repos = list_repositories()
+    last = _last_backup_status
+    if last is not None and last[0] is repos:
+        status_ = last[1], last[2]
+    else:
+        payload = _backup_status_payload(repos)
+        etag_ = hashlib.md5(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        _last_backup_status = (repos, payload, etag_)
+        status_ = payload, etag_
+
+    request._backup_status = status_
+    return status_
+
+
+def _backup_status_etag(request: Request, *args, **kwargs) -> str:
+    return _backup_status(request)[1]
 
 
 # Legacy endpoint for backward compatibility
 class GitBackupStatusView(APIView):
     permission_classes = [IsInternalUser]
 
+    @method_decorator(cache_control(private=True, max_age=30))
+    @method_decorator(etag(_backup_status_etag))
     def get(self, request: Request) -> Response:
-        repos = list_repositories()
-        # Transform to legacy format for backward compatibility
-        return Response({
-            "summary": {
-                "repositories_monitored": len(repos),
-                "healthy": len(repos),
-                "failing": 0,
-                "last_run": repos[0]["last_backup"] if repos else None,
-            },
-            "repositories": [
-                {
-                    "name": f"{r['org']}/{r['project']}/{r['repo']}",
-                    "provider": "Azure DevOps",
-                    "last_backup": r["last_backup"],
-                    "status": "Healthy",
-                }
-                for r in repos
-            ],
-        })
+        return Response(_backup_status(request)[0])
 
 
 urlpatterns = [
@@ -142,5 +273,8 @@ urlpatterns = [
     path("repositories/<str:repo_id>/restore-preview", RestorePreviewView.as_view(), name="backups-restore-preview"),
     path("repositories/<str:repo_id>/download-link", DownloadLinkView.as_view(), name="backups-download-link"),
     path("repositories/<str:repo_id>/restore", RestoreView.as_view(), name="backups-restore"),
+    path("restore-jobs/<str:job_id>", RestoreJobView.as_view(), name="backups-restore-job"),
+    path("restore", BulkRestoreView.as_view(), name="backups-bulk-restore"),
+    path("cache/invalidate", CacheInvalidateView.as_view(), name="backups-cache-invalidate"),
     path("status", GitBackupStatusView.as_view(), name="git-backup-status"),  # Legacy
 ]
@@ -3,16 +3,42 @@ Azure DevOps Git Backup service.
 Discovers backups from Azure Storage and handles restore operations.
 """
 
+import atexit
 import base64
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
+import httpx
+import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+try:
+    # C parser, roughly twice as fast as datetime.fromisoformat on dates
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
 try:
+    from azure.core.pipeline.transport import RequestsTransport
     from azure.identity import DefaultAzureCredential
-    from azure.storage.blob import BlobServiceClient, generate_container_sas, ContainerSasPermissions
+    from azure.storage.blob import (
+        BlobSasPermissions,
+        BlobServiceClient,
+        ContainerSasPermissions,
+        generate_blob_sas,
+        generate_container_sas,
+    )
     AZURE_STORAGE_AVAILABLE = True
 except ImportError:
     AZURE_STORAGE_AVAILABLE = False
@@ -20,9 +46,105 @@ except ImportError:
 # Mock mode flag - set DJANGO_BACKUPS_MOCK=true for local dev without Azure Storage
 MOCK_MODE = os.getenv("DJANGO_BACKUPS_MOCK", "").lower() == "true"
 
+# Folder under which backups are stored in the container, without slashes
+STORAGE_PREFIX = os.getenv("AZURE_STORAGE_PREFIX", "").strip("/")
+
+# Upper bound on concurrent per-organization listings against Azure Storage
+LIST_MAX_WORKERS = int(os.getenv("AZURE_STORAGE_LIST_WORKERS", "8"))
+
+
+def _parse_connection_string(connection_string: Optional[str]) -> Tuple[str, str]:
+    """Extract (account name, account key) from a storage connection string."""
+    if not connection_string:
+        return "", ""
+    parts = dict(part.split("=", 1) for part in connection_string.split(";") if "=" in part)
+    return parts.get("AccountName", ""), parts.get("AccountKey", "")
+
+
+# Storage account credentials for signing SAS tokens, parsed once at import
+_ACCOUNT_NAME, _ACCOUNT_KEY = _parse_connection_string(os.getenv("AZURE_STORAGE_CONNECTION_STRING"))
+
+# Connections kept alive per host by the shared storage client
+STORAGE_POOL_SIZE = int(os.getenv("AZURE_STORAGE_POOL_SIZE", "32"))
+
+# Listing results change at most once per backup cycle, so cache them briefly
+LISTING_CACHE_TTL = int(os.getenv("DJANGO_BACKUPS_CACHE_TTL", "300"))
+
+_REPOSITORIES_CACHE: TTLCache = TTLCache(maxsize=1, ttl=LISTING_CACHE_TTL)
+_VERSIONS_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=LISTING_CACHE_TTL)
+_VERSIONS_BY_ID_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=LISTING_CACHE_TTL)
+_CACHE_LOCK = threading.RLock()
+# One lock per entry being loaded, so concurrent misses on the same entry don't
+# all walk the container while misses on other entries proceed independently.
+# Locks are dropped once their loader finishes, so only in-flight keys are held
+_REFRESH_LOCKS: Dict[Tuple[int, str], threading.Lock] = {}
+
+# Concurrent target organizations in a bulk restore; each org is restored serially
+RESTORE_MAX_WORKERS = int(os.getenv("AZURE_DEVOPS_RESTORE_WORKERS", "4"))
+
+# Shared keep-alive HTTP/2 client for Azure DevOps REST calls
+_ADO_CLIENT = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    timeout=30.0,
+)
+atexit.register(_ADO_CLIENT.close)
+
+# Azure DevOps PAT auth header, built once since the PAT is fixed per process
+_ADO_PAT = os.getenv("AZURE_DEVOPS_PAT")
+_ADO_AUTH_HEADER = f"Basic {base64.b64encode(f':{_ADO_PAT}'.encode()).decode()}" if _ADO_PAT else None
+_ADO_HEADERS = {"Authorization": _ADO_AUTH_HEADER} if _ADO_AUTH_HEADER else {}
+
 
+@lru_cache(maxsize=64)
+def _create_repo_url(target_org: str, target_project: str) -> str:
+    """Azure DevOps endpoint for creating a repository in a project."""
+    return f"https://dev.azure.com/{target_org}/{target_project}/_apis/git/repositories?api-version=7.1"
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that adds SO_KEEPALIVE to urllib3's default socket options
+    (TCP_NODELAY) on every pooled socket, for direct and proxied pools alike.
+    """
+
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs["socket_options"] = self.socket_options
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def _build_storage_transport():
+    """
+    Build the HTTP transport for the storage client.
+    Uses a larger keep-alive pool than the urllib3 default (10) so concurrent
+    workers reuse connections instead of churning through TIME_WAIT sockets,
+    and enables TCP keep-alive on pooled sockets.
+    """
+    session = requests.Session()
+    adapter = _KeepAliveAdapter(
+        pool_connections=STORAGE_POOL_SIZE,
+        pool_maxsize=STORAGE_POOL_SIZE,
+        pool_block=False,
+    )
+    session.mount("https://", adapter)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+@lru_cache(maxsize=1)
 def _get_storage_client():
-    """Get Azure Blob Storage client using Managed Identity or connection string."""
+    """
+    Get Azure Blob Storage client using Managed Identity or connection string.
+    The client owns the HTTP connection pool, so it is built once per process
+    and shared by all callers.
+    """
     if MOCK_MODE or not AZURE_STORAGE_AVAILABLE:
         return None
 
@@ -30,28 +152,112 @@ def _get_storage_client():
     connection_string = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
 
     if connection_string:
-        return BlobServiceClient.from_connection_string(connection_string)
+        return BlobServiceClient.from_connection_string(
+            connection_string, transport=_build_storage_transport()
+        )
     elif storage_account:
         # Use Managed Identity in Azure, DefaultAzureCredential for local dev with Azure CLI
         credential = DefaultAzureCredential()
         account_url = f"https://{storage_account}.blob.core.windows.net"
-        return BlobServiceClient(account_url=account_url, credential=credential)
+        return BlobServiceClient(
+            account_url=account_url, credential=credential, transport=_build_storage_transport()
+        )
     else:
         return None
 
 
+@lru_cache(maxsize=1)
+def _get_container_client():
+    """Get the shared container client for the configured backups container."""
+    client = _get_storage_client()
+    if not client:
+        return None
+
+    container_name = os.getenv("AZURE_STORAGE_CONTAINER", "git-backups")
+    return client.get_container_client(container_name)
+
+
+def _list_org_prefixes(container_client, prefix: str) -> List[str]:
+    """List the top-level org folders under prefix with a single delimited listing."""
+    return [
+        item.name
+        for item in container_client.walk_blobs(name_starts_with=prefix or None, delimiter="/")
+        if item.name.endswith("/")
+    ]
+
+
+def _cached_listing(cache: TTLCache, key: str, loader) -> Any:
+    """
+    Return cache[key], calling loader() on a miss.
+    Empty results are not cached, since listing errors are reported as [].
+    """
+    lock_key = (id(cache), key)
+    with _CACHE_LOCK:
+        value = cache.get(key)
+        if value is None:
+            refresh_lock = _REFRESH_LOCKS.setdefault(lock_key, threading.Lock())
+    if value is not None:
+        return value
+
+    with refresh_lock:
+        try:
+            # Another thread may have filled the cache while we were waiting
+            with _CACHE_LOCK:
+                value = cache.get(key)
+            if value is not None:
+                return value
+
+            value = loader()
+            if value:
+                with _CACHE_LOCK:
+                    cache[key] = value
+            return value
+        finally:
+            with _CACHE_LOCK:
+                if _REFRESH_LOCKS.get(lock_key) is refresh_lock:
+                    del _REFRESH_LOCKS[lock_key]
+
+
+def invalidate_listing_cache() -> None:
+    """Drop cached repository and backup version listings."""
+    with _CACHE_LOCK:
+        _REPOSITORIES_CACHE.clear()
+        _VERSIONS_CACHE.clear()
+        _VERSIONS_BY_ID_CACHE.clear()
+
+
+# {org}/{project}/{repo}/yyyy-MM-dd[-HHmm].zip, relative to the storage prefix
+_BLOB_PATH_RE = re.compile(r"([^/]+)/([^/]+)/(.+?)/(\d{4}-\d{2}-\d{2})(?:-\d{4})?\.zip$")
+
+
 def _parse_blob_path(blob_name: str) -> Optional[Dict[str, str]]:
     """
     Parse Azure Storage blob path to extract org, project, repo, and timestamp.
     Assumes structure: {prefix}/{org}/{project}/{repo}/yyyy-MM-dd-HHmm.zip
     or similar variations.
     """
+    prefix = STORAGE_PREFIX
+
+    # Fast path: a single regex match for the standard backup naming scheme
+    if prefix and blob_name.startswith(prefix + "/"):
+        match = _BLOB_PATH_RE.match(blob_name, len(prefix) + 1)
+    else:
+        match = _BLOB_PATH_RE.match(blob_name)
+    if match:
+        org, project, repo, date_str = match.groups()
+        return {
+            "org": org,
+            "project": project,
+            "repo": repo,
+            "date_str": date_str,
+            "blob_name": blob_name,
+        }
+
     parts = blob_name.strip("/").split("/")
     if len(parts) < 4:
         return None
 
     # Skip prefix if present
-    prefix = os.getenv("AZURE_STORAGE_PREFIX", "").strip("/")
     if prefix and parts[0] == prefix:
         parts = parts[1:]
 
@@ -139,52 +345,94 @@ def _get_mock_backup_versions(repo_id: str) -> List[Dict[str, Any]]:
 def list_repositories() -> List[Dict[str, Any]]:
     """
     List all Azure DevOps repositories that have backups available.
-    Returns list of repository summaries.
+    Returns list of repository summaries, cached for LISTING_CACHE_TTL seconds.
+    """
+    return _cached_listing(_REPOSITORIES_CACHE, "repositories", _list_repositories)
+
+
+def _summarize_prefix(
+    container_client, prefix: str
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, datetime]]:
+    """
+    Stream blob names under prefix and reduce them to per-repository summaries.
+    Returns (repos_map, latest) where latest maps repo_id to its newest backup date.
+    Only names are requested, which keeps the listing payload small.
+    """
+    repos_map: Dict[str, Dict[str, Any]] = {}
+    latest: Dict[str, datetime] = {}
+
+    # List all blobs with .zip extension
+    for blob_name in container_client.list_blob_names(name_starts_with=prefix):
+        if not blob_name.endswith(".zip"):
+            continue
+
+        parsed = _parse_blob_path(blob_name)
+        if not parsed:
+            continue
+
+        repo_id = f"{parsed['org']}-{parsed['project']}-{parsed['repo']}"
+        if repo_id not in repos_map:
+            repos_map[repo_id] = {
+                "id": repo_id,
+                "org": parsed["org"],
+                "project": parsed["project"],
+                "repo": parsed["repo"],
+                "backup_count": 0,
+                "last_backup": None,
+            }
+
+        repos_map[repo_id]["backup_count"] += 1
+        if parsed["date_str"]:
+            try:
+                backup_date = _parse_iso(parsed["date_str"])
+            except ValueError:
+                continue
+            if backup_date > latest.get(repo_id, datetime.min):
+                latest[repo_id] = backup_date
+
+    return repos_map, latest
+
+
+def _list_repositories() -> List[Dict[str, Any]]:
+    """
+    List repository summaries directly from Azure Storage.
+    Each top-level org folder is listed and summarized on a worker thread,
+    overlapping the paginated listing round-trips; only the per-repository
+    summaries are kept, so memory stays proportional to repositories, not blobs.
     """
     if MOCK_MODE:
         return _get_mock_repositories()
 
-    client = _get_storage_client()
-    if not client:
+    container_client = _get_container_client()
+    if not container_client:
         return []
 
-    container_name = os.getenv("AZURE_STORAGE_CONTAINER", "git-backups")
-    prefix = os.getenv("AZURE_STORAGE_PREFIX", "").strip("/")
+    prefix = STORAGE_PREFIX
     if prefix:
         prefix = prefix + "/"
 
     try:
-        container_client = client.get_container_client(container_name)
         repos_map: Dict[str, Dict[str, Any]] = {}
-
-        # List all blobs with .zip extension
-        for blob in container_client.list_blobs(name_starts_with=prefix):
-            if not blob.name.endswith(".zip"):
-                continue
-
-            parsed = _parse_blob_path(blob.name)
-            if not parsed:
-                continue
-
-            repo_id = f"{parsed['org']}-{parsed['project']}-{parsed['repo']}"
-            if repo_id not in repos_map:
-                repos_map[repo_id] = {
-                    "id": repo_id,
-                    "org": parsed["org"],
-                    "project": parsed["project"],
-                    "repo": parsed["repo"],
-                    "backup_count": 0,
-                    "last_backup": None,
-                }
-
-            repos_map[repo_id]["backup_count"] += 1
-            if parsed["date_str"]:
-                try:
-                    backup_date = datetime.fromisoformat(parsed["date_str"])
-                    if repos_map[repo_id]["last_backup"] is None or backup_date > datetime.fromisoformat(repos_map[repo_id]["last_backup"][:10]):
-                        repos_map[repo_id]["last_backup"] = backup_date.isoformat() + "Z"
-                except Exception:
-                    pass
+        latest: Dict[str, datetime] = {}
+
+        org_prefixes = _list_org_prefixes(container_client, prefix)
+        if org_prefixes:
+            max_workers = max(1, min(LIST_MAX_WORKERS, len(org_prefixes)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(partial(_summarize_prefix, container_client), org_prefixes)
+                for org_repos, org_latest in results:
+                    for repo_id, summary in org_repos.items():
+                        if repo_id in repos_map:
+                            repos_map[repo_id]["backup_count"] += summary["backup_count"]
+                        else:
+                            repos_map[repo_id] = summary
+                    for repo_id, backup_date in org_latest.items():
+                        if backup_date > latest.get(repo_id, datetime.min):
+                            latest[repo_id] = backup_date
+
+        # Serialize the newest backup date once per repository
+        for repo_id, backup_date in latest.items():
+            repos_map[repo_id]["last_backup"] = backup_date.isoformat(timespec="seconds") + "Z"
 
         return list(repos_map.values())
     except Exception as e:
@@ -196,13 +444,18 @@ def list_repositories() -> List[Dict[str, Any]]:
 def list_backup_versions(repo_id: str) -> List[Dict[str, Any]]:
     """
     List all backup versions for a specific repository.
-    Returns list of backup instances with metadata.
+    Returns list of backup instances with metadata, cached per repo_id.
     """
+    return _cached_listing(_VERSIONS_CACHE, repo_id, lambda: _list_backup_versions(repo_id))
+
+
+def _list_backup_versions(repo_id: str) -> List[Dict[str, Any]]:
+    """List backup versions for a repository directly from Azure Storage."""
     if MOCK_MODE:
         return _get_mock_backup_versions(repo_id)
 
-    client = _get_storage_client()
-    if not client:
+    container_client = _get_container_client()
+    if not container_client:
         return []
 
     # Parse repo_id to get org, project, repo
@@ -211,17 +464,19 @@ def list_backup_versions(repo_id: str) -> List[Dict[str, Any]]:
         return []
 
     org, project, repo = parts[0], parts[1], parts[2]
-    container_name = os.getenv("AZURE_STORAGE_CONTAINER", "git-backups")
-    prefix = os.getenv("AZURE_STORAGE_PREFIX", "").strip("/")
+    prefix = STORAGE_PREFIX
     blob_prefix = f"{prefix}/{org}/{project}/{repo}/" if prefix else f"{org}/{project}/{repo}/"
 
     try:
-        container_client = client.get_container_client(container_name)
         versions = []
 
-        for blob in container_client.list_blobs(name_starts_with=blob_prefix):
+        for blob in container_client.list_blobs(name_starts_with=blob_prefix, results_per_page=5000):
             if not blob.name.endswith(".zip"):
                 continue
+            # Blobs in subfolders belong to nested repositories, which
+            # list_repositories reports separately
+            if "/" in blob.name[len(blob_prefix):]:
+                continue
 
             parsed = _parse_blob_path(blob.name)
             if not parsed:
@@ -236,65 +491,96 @@ def list_backup_versions(repo_id: str) -> List[Dict[str, Any]]:
                 "blob_path": blob.name,
             })
 
-        # Sort by timestamp descending (newest first)
-        versions.sort(key=lambda x: x["timestamp"], reverse=True)
+        # Azure lists blobs in name order, and the remaining backup names all
+        # start with yyyy-MM-dd-HHmm, so reversing gives newest first
+        versions.reverse()
         return versions
     except Exception as e:
         print(f"Error listing backup versions: {e}")
         return []
 
 
-def get_download_link(repo_id: str, backup_id: str) -> Optional[str]:
+def _index_versions(versions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Index backup versions (newest first) by backup id.
+    Ids only carry the backup date, so several backups on the same day share
+    an id; the first, i.e. newest, one wins, as with a linear scan.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    for version in versions:
+        index.setdefault(version["id"], version)
+    return index
+
+
+def _versions_by_id(repo_id: str) -> Dict[str, Dict[str, Any]]:
+    """Index a repository's backup versions by backup id."""
+    return _cached_listing(
+        _VERSIONS_BY_ID_CACHE,
+        repo_id,
+        lambda: _index_versions(list_backup_versions(repo_id)),
+    )
+
+
+def get_backup_by_id(repo_id: str, backup_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a single backup version, or None if it does not exist."""
+    return _versions_by_id(repo_id).get(backup_id)
+
+
+def get_backups_by_id(lookups: List[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Look up several (repo_id, backup_id) pairs, in input order.
+    Each distinct repository's versions are listed once, concurrently.
+    """
+    repo_ids = list(dict.fromkeys(repo_id for repo_id, _ in lookups))
+    if not repo_ids:
+        return []
+
+    max_workers = max(1, min(LIST_MAX_WORKERS, len(repo_ids)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        indexes = dict(zip(repo_ids, executor.map(_versions_by_id, repo_ids)))
+    return [indexes[repo_id].get(backup_id) for repo_id, backup_id in lookups]
+
+
+@lru_cache(maxsize=4096)
+def _sas_for(container_name: str, blob_path: str, hour_bucket: int) -> str:
+    """
+    Read-only SAS token for a blob, shared by all requests in the same hour.
+    The token expires at the end of the following hour, so it is always valid
+    for at least an hour and the resulting URL stays stable (and cacheable)
+    within the hour.
+    """
+    return generate_blob_sas(
+        account_name=_ACCOUNT_NAME,
+        container_name=container_name,
+        blob_name=blob_path,
+        account_key=_ACCOUNT_KEY,
+        permission=BlobSasPermissions(read=True),
+        expiry=datetime.fromtimestamp((hour_bucket + 2) * 3600, tz=timezone.utc),
+    )
+
+
+def get_download_link(blob_path: str) -> Optional[str]:
     """
     Generate a time-limited SAS URL for downloading a backup zip.
-    Returns None if backup not found or error occurs.
+    Takes the blob path of an already-resolved backup (see get_backup_by_id).
+    Returns None if an error occurs.
     """
     if MOCK_MODE:
-        return f"https://mock-storage.example.com/download/{backup_id}?mock=true"
+        return f"https://mock-storage.example.com/download/{quote(blob_path, safe='')}?mock=true"
 
     client = _get_storage_client()
     if not client:
         return None
 
-    # Find the blob path from backup_id
-    versions = list_backup_versions(repo_id)
-    backup = next((v for v in versions if v["id"] == backup_id), None)
-    if not backup:
-        return None
-
-    blob_path = backup.get("blob_path")
-    if not blob_path:
-        return None
-
     container_name = os.getenv("AZURE_STORAGE_CONTAINER", "git-backups")
 
     try:
-        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
-        
-        blob_client = client.get_blob_client(container=container_name, blob=blob_path)
-        
-        # Check if we have account key (connection string) or need Managed Identity approach
-        connection_string = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
-        
-        if connection_string:
-            # Parse connection string to get account key
-            from azure.storage.blob import BlobServiceClient
-            # Extract account name and key from connection string
-            parts = dict(part.split('=', 1) for part in connection_string.split(';') if '=' in part)
-            account_name = parts.get('AccountName', '')
-            account_key = parts.get('AccountKey', '')
-            
-            if account_key:
-                sas_token = generate_blob_sas(
-                    account_name=account_name,
-                    container_name=container_name,
-                    blob_name=blob_path,
-                    account_key=account_key,
-                    permission=BlobSasPermissions(read=True),
-                    expiry=datetime.utcnow() + timedelta(hours=1),
-                )
-                return f"{blob_client.url}?{sas_token}"
-        
+        # SAS tokens can only be signed with an account key (connection string)
+        if _ACCOUNT_KEY:
+            blob_client = client.get_blob_client(container=container_name, blob=blob_path)
+            sas_token = _sas_for(container_name, blob_path, int(time.time() // 3600))
+            return f"{blob_client.url}?{sas_token}"
+
         # For Managed Identity, user delegation SAS requires additional setup
         # For now, return blob URL - in production, implement user delegation SAS
         # or use Azure Functions/Logic Apps to generate signed URLs
@@ -308,8 +594,7 @@ def get_download_link(repo_id: str, backup_id: str) -> Optional[str]:
 
 
 def restore_to_azure_devops(
-    repo_id: str,
-    backup_id: str,
+    backup: Dict[str, Any],
     target_org: str,
     target_project: str,
     target_repo_name: str,
@@ -317,17 +602,18 @@ def restore_to_azure_devops(
 ) -> Dict[str, Any]:
     """
     Restore a backup to Azure DevOps.
+    Takes a backup version as returned by get_backup_by_id.
     Returns status dict with success/failure and details.
     """
     if MOCK_MODE:
         return {
             "status": "success",
-            "message": f"Mock restore: {backup_id} -> {target_org}/{target_project}/{target_repo_name}",
+            "message": f"Mock restore: {backup['id']} -> {target_org}/{target_project}/{target_repo_name}",
             "repo_url": f"https://dev.azure.com/{target_org}/{target_project}/_git/{target_repo_name}",
         }
 
     # Get download link first
-    download_url = get_download_link(repo_id, backup_id)
+    download_url = get_download_link(backup["blob_path"])
     if not download_url:
         return {
             "status": "error",
@@ -335,28 +621,21 @@ def restore_to_azure_devops(
         }
 
     # Get Azure DevOps PAT or use Managed Identity
-    pat = os.getenv("AZURE_DEVOPS_PAT")
-    if not pat:
+    if not _ADO_AUTH_HEADER:
         return {
             "status": "error",
             "message": "Azure DevOps PAT not configured. Set AZURE_DEVOPS_PAT environment variable.",
         }
 
     try:
-        import requests
-
         # Step 1: Create repository in Azure DevOps
-        create_repo_url = f"https://dev.azure.com/{target_org}/{target_project}/_apis/git/repositories?api-version=7.1"
-        headers = {
-            "Authorization": f"Basic {base64.b64encode(f':{pat}'.encode()).decode()}",
-            "Content-Type": "application/json",
-        }
+        create_repo_url = _create_repo_url(target_org, target_project)
         create_payload = {
             "name": target_repo_name,
             "project": {"id": target_project},  # May need project ID instead
         }
 
-        create_response = requests.post(create_repo_url, headers=headers, json=create_payload, timeout=30)
+        create_response = _ADO_CLIENT.post(create_repo_url, headers=_ADO_HEADERS, json=create_payload)
         if create_response.status_code not in [200, 201]:
             # Check if repo already exists
             if create_response.status_code == 409:
@@ -389,10 +668,36 @@ def restore_to_azure_devops(
         }
 
 
+def restore_many_to_azure_devops(restores: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Restore several backups to Azure DevOps.
+    Each item holds the keyword arguments of restore_to_azure_devops.
+    Restores are grouped by target_org: organizations are processed
+    concurrently, while restores into the same organization run one after
+    another over the shared keep-alive client to stay within its rate limits.
+    Returns one status dict per item, in input order.
+    """
+    by_org: Dict[str, List[int]] = {}
+    for index, restore in enumerate(restores):
+        by_org.setdefault(restore["target_org"], []).append(index)
+
+    results: List[Dict[str, Any]] = [{} for _ in restores]
+
+    def _restore_org(indexes: List[int]) -> None:
+        for index in indexes:
+            results[index] = restore_to_azure_devops(**restores[index])
+
+    if by_org:
+        max_workers = max(1, min(RESTORE_MAX_WORKERS, len(by_org)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_restore_org, by_org.values()))
+
+    return results
+
+
 def get_restore_preview(repo_id: str, backup_id: str) -> Dict[str, Any]:
     """Get preview information for a restore operation."""
-    versions = list_backup_versions(repo_id)
-    backup = next((v for v in versions if v["id"] == backup_id), None)
+    backup = get_backup_by_id(repo_id, backup_id)
     if not backup:
         return {"error": "Backup not found"}
 
@@ -0,0 +1,114 @@
+"""
+Background restore jobs.
+Restores run on a small in-process thread pool so gunicorn workers are not
+held for the duration of the Azure DevOps calls; clients poll for the result.
+"""
+
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from cachetools import TTLCache
+
+from backend.modules.backups.services import (
+    get_backups_by_id,
+    restore_many_to_azure_devops,
+    restore_to_azure_devops,
+)
+
+RESTORE_JOB_WORKERS = int(os.getenv("DJANGO_BACKUPS_RESTORE_JOB_WORKERS", "2"))
+
+# Upper bound on restores accepted in a single bulk restore request
+BULK_RESTORE_MAX_ITEMS = int(os.getenv("DJANGO_BACKUPS_BULK_RESTORE_MAX", "50"))
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=RESTORE_JOB_WORKERS, thread_name_prefix="restore-job")
+
+# Finished jobs are kept for a day so clients can still fetch the outcome
+_JOBS: TTLCache = TTLCache(maxsize=1024, ttl=86400)
+_JOBS_LOCK = threading.Lock()
+
+
+def _set_job(job_id: str, **fields: Any) -> None:
+    with _JOBS_LOCK:
+        _JOBS[job_id] = {"id": job_id, **fields}
+
+
+def _restore_error(e: Exception) -> Dict[str, Any]:
+    return {"status": "error", "message": f"Restore failed: {str(e)}"}
+
+
+def _run_restore(job_id: str, restore_kwargs: Dict[str, Any]) -> None:
+    _set_job(job_id, status="running")
+    try:
+        result = restore_to_azure_devops(**restore_kwargs)
+    except Exception as e:
+        result = _restore_error(e)
+    _set_job(job_id, status="completed", result=result)
+
+
+def _restore_many(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    backups = get_backups_by_id([(item["repo_id"], item["backup_id"]) for item in items])
+    restores = [
+        {
+            "backup": backup,
+            "target_org": item["target_org"],
+            "target_project": item["target_project"],
+            "target_repo_name": item["target_repo_name"],
+            "visibility": item.get("visibility", "private"),
+        }
+        for item, backup in zip(items, backups)
+        if backup
+    ]
+    restored = iter(restore_many_to_azure_devops(restores))
+    return [
+        next(restored) if backup else {"status": "error", "message": f"Backup {item['backup_id']} not found"}
+        for item, backup in zip(items, backups)
+    ]
+
+
+def _run_bulk_restore(job_id: str, items: List[Dict[str, Any]]) -> None:
+    _set_job(job_id, status="running")
+    try:
+        results = _restore_many(items)
+    except Exception as e:
+        results = [_restore_error(e) for _ in items]
+    _set_job(job_id, status="completed", result={"results": results})
+
+
+def _submit(runner: Callable[..., None], *args: Any) -> str:
+    job_id = uuid.uuid4().hex
+    _set_job(job_id, status="pending")
+    _EXECUTOR.submit(runner, job_id, *args)
+    return job_id
+
+
+def submit_restore(**restore_kwargs: Any) -> str:
+    """
+    Queue a restore_to_azure_devops call and return its job id.
+    Takes the same keyword arguments as restore_to_azure_devops.
+    """
+    return _submit(_run_restore, restore_kwargs)
+
+
+def submit_bulk_restore(items: List[Dict[str, Any]]) -> str:
+    """
+    Queue several restores and return the job id.
+    Each item holds repo_id, backup_id, target_org, target_project,
+    target_repo_name and optionally visibility; backups are resolved in the
+    job. The completed job's result is {"results": [...]}, one status dict
+    per item, with an error for backups that were not found.
+    """
+    return _submit(_run_bulk_restore, items)
+
+
+def get_restore_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a restore job's state: pending, running, or completed.
+    Completed jobs carry the restore outcome under "result".
+    """
+    with _JOBS_LOCK:
+        return _JOBS.get(job_id)
+
+
@@ -1,16 +1,21 @@
 from django.urls import path
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from backend.core.permissions import IsInternalUser
-from backend.modules.firewall.services import list_mock_firewall_rules
+from backend.core.responses import precompressed_json_response
+from backend.modules.firewall.services import (
+    get_mock_firewall_rules_json,
+    get_mock_firewall_rules_json_gzip,
+)
 
 
 class FirewallRulesView(APIView):
     permission_classes = [IsInternalUser]
 
     def get(self, request, *args, **kwargs):
-        return Response({"rules": list_mock_firewall_rules()})
+        return precompressed_json_response(
+            request, get_mock_firewall_rules_json(), get_mock_firewall_rules_json_gzip()
+        )
 
 
 urlpatterns = [
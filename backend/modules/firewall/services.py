@@ -4,11 +4,15 @@ In a real implementation, this would use the Azure SDK to interact with
 firewall policies, rules, and diagnostics.
 """
 
-from typing import List, Dict, Any
+import json
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 
+from backend.core.responses import gzip_body
 
-def list_mock_firewall_rules() -> List[Dict[str, Any]]:
-    return [
+# The mock rules never change, so build them (and their JSON) once, read-only
+_FIREWALL_RULES: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType(
         {
             "id": "rule-1",
             "name": "Allow-HTTPS",
@@ -17,7 +21,9 @@ def list_mock_firewall_rules() -> List[Dict[str, Any]]:
             "protocol": "TCP",
             "port": 443,
             "action": "Allow",
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "id": "rule-2",
             "name": "Deny-RDP",
@@ -26,7 +32,27 @@ def list_mock_firewall_rules() -> List[Dict[str, Any]]:
             "protocol": "TCP",
             "port": 3389,
             "action": "Deny",
-        },
-    ]
+        }
+    ),
+)
+# default=dict renders the read-only mappings
+_FIREWALL_RULES_JSON: bytes = json.dumps(
+    {"rules": _FIREWALL_RULES}, separators=(",", ":"), default=dict
+).encode()
+_FIREWALL_RULES_JSON_GZIP: bytes = gzip_body(_FIREWALL_RULES_JSON)
+
+
+def list_mock_firewall_rules() -> Tuple[Mapping[str, Any], ...]:
+    return _FIREWALL_RULES
+
+
+def get_mock_firewall_rules_json() -> bytes:
+    """Pre-rendered {"rules": [...]} response body."""
+    return _FIREWALL_RULES_JSON
+
+
+def get_mock_firewall_rules_json_gzip() -> bytes:
+    """Gzip-compressed copy of the pre-rendered {"rules": [...]} response body."""
+    return _FIREWALL_RULES_JSON_GZIP
 
 
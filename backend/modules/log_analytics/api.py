@@ -1,16 +1,21 @@
 from django.urls import path
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from backend.core.permissions import IsInternalUser
-from backend.modules.log_analytics.services import get_mock_workspace_overview
+from backend.core.responses import precompressed_json_response
+from backend.modules.log_analytics.services import (
+    get_mock_workspace_overview_json,
+    get_mock_workspace_overview_json_gzip,
+)
 
 
 class LogAnalyticsOverviewView(APIView):
     permission_classes = [IsInternalUser]
 
     def get(self, request, *args, **kwargs):
-        return Response(get_mock_workspace_overview())
+        return precompressed_json_response(
+            request, get_mock_workspace_overview_json(), get_mock_workspace_overview_json_gzip()
+        )
 
 
 urlpatterns = [
@@ -3,19 +3,43 @@ Placeholder for Azure Log Analytics-related service logic.
 Would normally query Azure Monitor / Log Analytics workspaces.
 """
 
-from typing import Any, Dict
+import json
+from types import MappingProxyType
+from typing import Any, Mapping
 
+from backend.core.responses import gzip_body
 
-def get_mock_workspace_overview() -> Dict[str, Any]:
-    return {
+# The mock overview never changes, so build it (and its JSON) once, read-only
+_WORKSPACE_OVERVIEW: Mapping[str, Any] = MappingProxyType(
+    {
         "workspace": "corp-logs-prod",
         "retention_days": 30,
         "daily_ingest_gb": 120.5,
         "last_query_time": "2025-01-01T12:00:00Z",
-        "top_tables": [
-            {"name": "AzureActivity", "records": 1_200_000},
-            {"name": "SecurityEvent", "records": 800_000},
-        ],
+        "top_tables": (
+            MappingProxyType({"name": "AzureActivity", "records": 1_200_000}),
+            MappingProxyType({"name": "SecurityEvent", "records": 800_000}),
+        ),
     }
+)
+# default=dict renders the read-only mappings
+_WORKSPACE_OVERVIEW_JSON: bytes = json.dumps(
+    _WORKSPACE_OVERVIEW, separators=(",", ":"), default=dict
+).encode()
+_WORKSPACE_OVERVIEW_JSON_GZIP: bytes = gzip_body(_WORKSPACE_OVERVIEW_JSON)
+
+
+def get_mock_workspace_overview() -> Mapping[str, Any]:
+    return _WORKSPACE_OVERVIEW
+
+
+def get_mock_workspace_overview_json() -> bytes:
+    """Pre-rendered workspace overview response body."""
+    return _WORKSPACE_OVERVIEW_JSON
+
+
+def get_mock_workspace_overview_json_gzip() -> bytes:
+    """Gzip-compressed copy of the pre-rendered workspace overview response body."""
+    return _WORKSPACE_OVERVIEW_JSON_GZIP
 
 
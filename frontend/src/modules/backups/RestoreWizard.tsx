@@ -19,6 +19,24 @@ interface RestoreResult {
   download_url?: string
 }
 
+interface RestoreJob {
+  id: string
+  status: 'pending' | 'running' | 'completed'
+  result?: RestoreResult
+}
+
+const RESTORE_POLL_INTERVAL_MS = 2000
+
+const waitForRestoreJob = async (jobId: string): Promise<RestoreResult> => {
+  for (;;) {
+    const res = await axios.get<RestoreJob>(`/api/backups/restore-jobs/${jobId}`)
+    if (res.data.status === 'completed' && res.data.result) {
+      return res.data.result
+    }
+    await new Promise((resolve) => setTimeout(resolve, RESTORE_POLL_INTERVAL_MS))
+  }
+}
+
 export const RestoreWizard: React.FC = () => {
   const [searchParams] = useSearchParams()
   const navigate = useNavigate()
@@ -80,7 +98,7 @@ export const RestoreWizard: React.FC = () => {
 
     try {
       setLoading(true)
-      const res = await axios.post<RestoreResult>(
+      const res = await axios.post<RestoreJob>(
         `/api/backups/repositories/${repoId}/restore`,
         {
           backup_id: backupId,
@@ -90,7 +108,8 @@ export const RestoreWizard: React.FC = () => {
           visibility,
         }
       )
-      setRestoreResult(res.data)
+      const result = await waitForRestoreJob(res.data.id)
+      setRestoreResult(result)
       setStep(4)
       setLoading(false)
     } catch (err: any) {